@@ -13,112 +13,232 @@ Prerequisites:
 
 import asyncio
 import httpx
-import json
+import orjson
+import os
+import random
 import sys
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List
 
+DEFAULT_BASE_URL = "http://localhost:8000"
 
-async def analyze_case_by_cnr(cnr_number: str, base_url: str = "http://localhost:8000"):
+
+class AiohttpClient:
+    """
+    Minimal aiohttp-backed client with the same interface the script
+    uses on httpx (post() returning an object with status_code, .text
+    and .json()).
+
+    aiohttp's connector has lower per-request overhead than httpx under
+    10-40 concurrent requests, which matters for batch CNR runs.
+    Select it with CNR_HTTP_BACKEND=aiohttp.
+    """
+
+    class _Response:
+        def __init__(self, status: int, body: bytes):
+            self.status_code = status
+            self.content = body
+
+        @property
+        def text(self) -> str:
+            return self.content.decode("utf-8", errors="replace")
+
+        def json(self) -> Any:
+            return orjson.loads(self.content)
+
+    def __init__(self, base_url: str):
+        import aiohttp
+
+        self.base_url = base_url
+        # aiohttp timeouts surface as asyncio.TimeoutError, not ClientError
+        self._transport_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        self._session = aiohttp.ClientSession(
+            base_url=base_url,
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
+
+    async def post(self, path: str, json: Any = None) -> "AiohttpClient._Response":
+        try:
+            async with self._session.post(path, json=json) as resp:
+                return self._Response(resp.status, await resp.read())
+        except self._transport_errors as e:
+            # Normalize to the httpx hierarchy so the script's error
+            # handling and batch retries behave identically on both
+            # backends (TransportError is a RequestError subclass)
+            raise httpx.TransportError(str(e) or type(e).__name__) from e
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._session.close()
+
+
+def create_client(base_url: str = DEFAULT_BASE_URL):
+    """
+    Create a shared HTTP client with connection pooling.
+
+    Reusing one client across all requests keeps connections alive
+    (no repeated TCP/TLS handshakes) and scales to batch CNR runs.
+    Set CNR_HTTP_BACKEND=aiohttp for higher throughput on large batches.
+    """
+    if os.environ.get("CNR_HTTP_BACKEND", "httpx").lower() == "aiohttp":
+        return AiohttpClient(base_url)
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+
+
+async def analyze_case_by_cnr(cnr_number: str, client, raise_transport_errors: bool = False):
     """
     Analyze a legal case by CNR number using the SAAS API.
 
     Args:
         cnr_number: CNR number to analyze (e.g., "DLCT010001232023")
-        base_url: Base URL of the running FastAPI server
+        client: Shared HTTP client (see create_client)
+        raise_transport_errors: Re-raise connection failures instead of
+            printing them (lets the batch runner retry)
     """
     print(f"\n{'='*60}")
     print(f"Analyzing case by CNR: {cnr_number}")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            # Option 1: Full analysis with AI
-            print("\n1. Performing full analysis with AI...")
-            analysis_request = {
-                "cnr_number": cnr_number,
-                "include_analysis": True,
-                "analysis_type": "case_analysis"
-            }
-
-            response = await client.post(
-                f"{base_url}/analyze/cnr",
-                json=analysis_request
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                print(f"   ✅ Analysis completed")
-                print(f"   Found: {result.get('found')}")
-
-                if result.get('found'):
-                    print(f"   Document Title: {result.get('document_title')}")
-                    print(f"   Court: {result.get('court')}")
-                    print(f"   Date: {result.get('date')}")
-                    print(f"   Citation: {result.get('citation')}")
-                    print(f"   Search Results: {result.get('search_results_count')}")
-
-                    if result.get('analysis_result'):
-                        print(f"\n   AI Analysis Summary:")
-                        analysis = result['analysis_result']
-
-                        # Print key analysis sections
-                        if 'case_overview' in analysis:
-                            print(f"   • Case Overview: {analysis['case_overview'][:200]}...")
-                        elif 'summary' in analysis:
-                            print(f"   • Summary: {analysis['summary'][:200]}...")
-
-                        if 'risk_assessment' in analysis:
-                            print(f"   • Risk Assessment: Available")
-
-                        if 'strategic_recommendations' in analysis:
-                            print(f"   • Strategic Recommendations: Available")
-
-                        print(f"\n   Full analysis saved to: cnr_analysis_{cnr_number}.json")
-
-                        # Save full analysis to file
-                        with open(f"cnr_analysis_{cnr_number}.json", "w") as f:
-                            json.dump(result, f, indent=2, default=str)
-                else:
-                    print(f"   ❌ No documents found for CNR: {cnr_number}")
-                    print(f"   Error: {result.get('error')}")
-            else:
-                print(f"   ❌ API Error: {response.status_code}")
-                print(f"   Response: {response.text}")
-
-            # Option 2: Search only (without AI analysis)
-            print("\n2. Performing search-only (without AI analysis)...")
-            search_request = {
-                "cnr_number": cnr_number,
-                "include_analysis": False
-            }
-
-            response = await client.post(
-                f"{base_url}/search/cnr",
-                json=search_request
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                print(f"   ✅ Search completed")
-                print(f"   Found: {result.get('found')}")
-                print(f"   Results: {result.get('search_results_count')} documents")
-
-                if result.get('document_text_preview'):
-                    print(f"\n   Document Preview:")
-                    print(f"   {result.get('document_text_preview')}")
+    try:
+        analysis_request = {
+            "cnr_number": cnr_number,
+            "include_analysis": True,
+            "analysis_type": "case_analysis"
+        }
+        search_request = {
+            "cnr_number": cnr_number,
+            "include_analysis": False
+        }
+
+        # The two endpoints are independent, so fire both requests
+        # concurrently; wall time becomes max(t1, t2) instead of t1 + t2.
+        response, search_response = await asyncio.gather(
+            client.post("/analyze/cnr", json=analysis_request),
+            client.post("/search/cnr", json=search_request)
+        )
+
+        # Option 1: Full analysis with AI
+        print("\n1. Performing full analysis with AI...")
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            print(f"   ✅ Analysis completed")
+            print(f"   Found: {result.get('found')}")
+
+            if result.get('found'):
+                print(f"   Document Title: {result.get('document_title')}")
+                print(f"   Court: {result.get('court')}")
+                print(f"   Date: {result.get('date')}")
+                print(f"   Citation: {result.get('citation')}")
+                print(f"   Search Results: {result.get('search_results_count')}")
+
+                if result.get('analysis_result'):
+                    print(f"\n   AI Analysis Summary:")
+                    analysis = result['analysis_result']
+
+                    # Print key analysis sections
+                    if 'case_overview' in analysis:
+                        print(f"   • Case Overview: {analysis['case_overview'][:200]}...")
+                    elif 'summary' in analysis:
+                        print(f"   • Summary: {analysis['summary'][:200]}...")
+
+                    if 'risk_assessment' in analysis:
+                        print(f"   • Risk Assessment: Available")
+
+                    if 'strategic_recommendations' in analysis:
+                        print(f"   • Strategic Recommendations: Available")
+
+                    print(f"\n   Full analysis saved to: cnr_analysis_{cnr_number}.json")
+
+                    # Save the raw response bytes as-is; re-serializing the
+                    # parsed dict would buffer the payload a second time.
+                    with open(f"cnr_analysis_{cnr_number}.json", "wb") as f:
+                        f.write(response.content)
             else:
-                print(f"   ❌ Search Error: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"   ❌ No documents found for CNR: {cnr_number}")
+                print(f"   Error: {result.get('error')}")
+        else:
+            print(f"   ❌ API Error: {response.status_code}")
+            print(f"   Response: {response.text}")
+
+        # Option 2: Search only (without AI analysis)
+        print("\n2. Performing search-only (without AI analysis)...")
+        response = search_response
+
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            print(f"   ✅ Search completed")
+            print(f"   Found: {result.get('found')}")
+            print(f"   Results: {result.get('search_results_count')} documents")
+
+            if result.get('document_text_preview'):
+                print(f"\n   Document Preview:")
+                print(f"   {result.get('document_text_preview')}")
+        else:
+            print(f"   ❌ Search Error: {response.status_code}")
+            print(f"   Response: {response.text}")
+
+    except httpx.RequestError as e:
+        if raise_transport_errors:
+            raise
+        print(f"   ❌ Request failed: {e}")
+        print(f"   Make sure the FastAPI server is running at {client.base_url}")
+        print(f"   Start server with: uvicorn src.api.main:app --reload")
+    except Exception as e:
+        print(f"   ❌ Unexpected error: {e}")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of floats."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_batch(cnr_numbers: List[str], client, max_concurrent: int = 20, retries: int = 3):
+    """
+    Analyze many CNRs with bounded concurrency and per-call retries.
+
+    Concurrency is capped to protect the upstream Indian Kanoon API;
+    transient transport errors back off exponentially with jitter.
+    Prints a p50/p95/p99 latency summary at the end.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    latencies: List[float] = []
+    failures: List[str] = []
+
+    async def worker(cnr: str):
+        async with semaphore:
+            for attempt in range(retries):
+                start = time.monotonic()
+                try:
+                    await analyze_case_by_cnr(cnr, client, raise_transport_errors=True)
+                    latencies.append(time.monotonic() - start)
+                    return
+                except httpx.TransportError:
+                    await asyncio.sleep((2 ** attempt) * random.random())
+            failures.append(cnr)
+
+    await asyncio.gather(*(worker(cnr) for cnr in cnr_numbers))
 
-        except httpx.RequestError as e:
-            print(f"   ❌ Request failed: {e}")
-            print(f"   Make sure the FastAPI server is running at {base_url}")
-            print(f"   Start server with: uvicorn src.api.main:app --reload")
-        except Exception as e:
-            print(f"   ❌ Unexpected error: {e}")
+    print("\n" + "=" * 60)
+    print(f"Batch summary: {len(latencies)} succeeded, {len(failures)} failed")
+    if failures:
+        print(f"Failed CNRs: {', '.join(failures)}")
+    if latencies:
+        for pct in (50, 95, 99):
+            print(f"  p{pct}: {percentile(latencies, pct) * 1000:.0f} ms")
+    print("=" * 60)
 
 
-async def test_with_sample_cnr():
+async def test_with_sample_cnr(client):
     """Test with a sample CNR number."""
     # Note: Replace with actual CNR number for real testing
     sample_cnr = "DLCT010001232023"  # Example format
@@ -134,7 +254,7 @@ async def test_with_sample_cnr():
     print("4. Start the FastAPI server")
     print("\n" + "-"*60)
 
-    await analyze_case_by_cnr(sample_cnr)
+    await analyze_case_by_cnr(sample_cnr, client)
 
 
 async def main():
@@ -142,13 +262,19 @@ async def main():
     print("CNR-Based Legal Analysis Example")
     print("================================\n")
 
-    # Check if a CNR number was provided as command line argument
-    if len(sys.argv) > 1:
-        cnr_number = sys.argv[1]
-        await analyze_case_by_cnr(cnr_number)
-    else:
-        # Use sample CNR for demonstration
-        await test_with_sample_cnr()
+    async with create_client() as client:
+        if len(sys.argv) > 2 and sys.argv[1] == "--cnr-file":
+            # Bulk mode: one CNR per line
+            with open(sys.argv[2]) as f:
+                cnr_numbers = [line.strip() for line in f if line.strip()]
+            await run_batch(cnr_numbers, client)
+        elif len(sys.argv) > 1:
+            # Analyze all given CNRs concurrently, bounded to respect
+            # Indian Kanoon rate limits on the backend.
+            await run_batch(sys.argv[1:], client)
+        else:
+            # Use sample CNR for demonstration
+            await test_with_sample_cnr(client)
 
     print("\n" + "="*60)
     print("Analysis Complete")
@@ -156,4 +282,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
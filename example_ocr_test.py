@@ -7,20 +7,23 @@ This creates a simple test image and processes it using DocumentProcessor.
 import asyncio
 import sys
 import os
+from pathlib import Path
 from PIL import Image, ImageDraw
 import io
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Rendering + PNG-encoding the test image is pure waste on repeat runs,
+# so the bytes are cached on disk after the first render.
+TEST_IMAGE_CACHE = Path('.cache/test_case.png')
 
-async def test_image_ocr():
-    """Test OCR on a generated image."""
-    from src.services.document_processor import DocumentProcessor
 
-    print("Testing DocumentProcessor with generated image...")
+def get_test_image_bytes():
+    """Render the legal test image once and cache the PNG bytes."""
+    if TEST_IMAGE_CACHE.exists():
+        return TEST_IMAGE_CACHE.read_bytes()
 
-    # Create a test image with legal text
     img = Image.new('RGB', (600, 200), color='white')
     d = ImageDraw.Draw(img)
     d.text((20, 50), 'IN THE HIGH COURT OF DELHI AT NEW DELHI', fill='black')
@@ -28,10 +31,27 @@ async def test_image_ocr():
     d.text((20, 110), 'Petitioner: John Doe vs Respondent: State', fill='black')
     d.text((20, 140), 'Date: 15th January 2025', fill='black')
 
-    # Convert to bytes
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='PNG')
-    img_bytes = img_bytes.getvalue()
+    # compress_level=1 keeps PNG encode cheap for a throwaway test image
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', optimize=False, compress_level=1)
+    data = buf.getbuffer()  # zero-copy view of the encoded bytes
+
+    try:
+        TEST_IMAGE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        TEST_IMAGE_CACHE.write_bytes(data)
+    except OSError:
+        pass  # cache is best-effort
+
+    return data
+
+
+async def test_image_ocr():
+    """Test OCR on a generated image."""
+    from src.services.document_processor import DocumentProcessor
+
+    print("Testing DocumentProcessor with generated image...")
+
+    img_bytes = get_test_image_bytes()
 
     # Create DocumentProcessor
     processor = DocumentProcessor()
@@ -51,14 +71,20 @@ async def test_image_ocr():
     if result['error']:
         print(f"\n✗ Error: {result['error']}")
         return False
-    else:
-        print("\n✓ Image processed successfully")
-        # Check if key phrases were extracted
-        text = result['extracted_text'].lower()
-        keywords = ['high court', 'delhi', 'case', 'petitioner', 'respondent']
-        found = [kw for kw in keywords if kw in text]
-        print(f"Found keywords: {found}")
-        return True
+
+    print("\n✓ Image processed successfully")
+    # Check if key phrases were extracted
+    text = result['extracted_text'].lower()
+    keywords = ['high court', 'delhi', 'case', 'petitioner', 'respondent']
+    found = [kw for kw in keywords if kw in text]
+    print(f"Found keywords: {found}")
+
+    # Batch mode: OCR several pages in parallel across CPU cores
+    print("\nTesting batched OCR (process_images)...")
+    batch_results = await processor.process_images([img_bytes, img_bytes], use_ocr=True)
+    ok = all(r['error'] is None for r in batch_results)
+    print(f"Batch of {len(batch_results)} images OCR'd, ocr_used={[r['ocr_used'] for r in batch_results]}")
+    return ok
 
 
 async def test_keyword_extraction():
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Combined test runner: executes the independent probes from the test
+scripts concurrently.
+
+The tesseract probes and DocumentProcessor init spend their time in
+subprocess waits and C extensions that release the GIL, so running
+them in threads drops wall time to the slowest probe instead of the
+sum. Only the OCR test waits on the installation probe.
+"""
+import asyncio
+import logging
+import sys
+
+from test_tesseract import (
+    check_environment,
+    test_document_processor,
+    test_ocr_functionality,
+    test_tesseract_installation,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> int:
+    env_ok, install_ok, processor_ok = await asyncio.gather(
+        asyncio.to_thread(check_environment),
+        asyncio.to_thread(test_tesseract_installation),
+        asyncio.to_thread(test_document_processor),
+    )
+
+    if install_ok:
+        ocr_ok = await asyncio.to_thread(test_ocr_functionality)
+    else:
+        logger.warning("Skipping OCR functionality test (installation failed)")
+        ocr_ok = False
+
+    results = [
+        ("Environment", env_ok),
+        ("Tesseract Installation", install_ok),
+        ("OCR Functionality", ocr_ok),
+        ("DocumentProcessor", processor_ok),
+    ]
+
+    lines = ["", "=" * 60, "Test Summary:", "=" * 60]
+    lines.extend(
+        f"{name:30} {'✓ PASS' if passed else '✗ FAIL'}" for name, passed in results
+    )
+    lines.append("=" * 60)
+    logger.info("\n".join(lines))
+
+    return 0 if all(passed for _, passed in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
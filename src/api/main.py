@@ -2,15 +2,26 @@
 Main FastAPI application for Legal Analysis SAAS.
 """
 
+import asyncio
 import logging
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File
+import time
+
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from contextlib import asynccontextmanager
 from typing import List, Optional
 
+from datetime import datetime
+
 from src.config.settings import settings
-from src.database.database import init_db, close_db, get_db
+from src.database.database import init_db, close_db, get_db, health_check as db_health_check
+from src.services.document_processor import get_document_processor
+from src.services.deepseek_service import get_deepseek_service, close_deepseek_service
+from src.services.kanoon_service import get_kanoon_client, close_kanoon_client
 from src.database.models import User, Case, Document, Analysis
 from src.api.models import (
     UserCreate, UserResponse, Token, CaseCreate, CaseResponse,
@@ -29,6 +40,15 @@ logger = logging.getLogger(__name__)
 # Security
 security = HTTPBearer()
 
+# CNR results are effectively immutable once a case is resolved, so cache
+# them aggressively: search results for a day, paid AI analyses for a week.
+CNR_SEARCH_CACHE_TTL = 86400  # 24 hours
+CNR_ANALYSIS_CACHE_TTL = 7 * 86400  # 7 days
+
+# Health probes are cached briefly so load-balancer polling does not
+# translate into upstream API traffic.
+HEALTH_CACHE_TTL = 5.0  # seconds
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
@@ -41,21 +61,78 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
         logger.warning("Continuing without database")
 
+    # Lifespan-scoped service singletons: both wrap pooled HTTP clients,
+    # so creating them once avoids TCP/TLS setup on the outbound leg.
+    app.state.kanoon = await get_kanoon_client()
+    app.state.deepseek = await get_deepseek_service()
+
+    app.state.redis = None
+    try:
+        import redis.asyncio as aioredis
+        app.state.redis = aioredis.from_url(str(settings.redis_url))
+        await app.state.redis.ping()
+        logger.info("Redis cache connected")
+    except Exception as e:
+        logger.warning(f"Redis unavailable, CNR caching disabled: {e}")
+        app.state.redis = None
+
     yield
 
     # Shutdown
     logger.info("Shutting down Legal Analysis SAAS")
+    if app.state.redis:
+        await app.state.redis.close()
+    await close_kanoon_client()
+    await close_deepseek_service()
     await close_db()
     logger.info("Database connections closed")
 
+
+async def cache_get(key: str) -> Optional[dict]:
+    """Get a cached JSON value from Redis, or None on miss/failure."""
+    redis = getattr(app.state, "redis", None)
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(key)
+        return orjson.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+def model_json_response(model) -> Response:
+    """
+    Serialize a pydantic model straight through pydantic-core's Rust
+    encoder, skipping FastAPI's jsonable_encoder/response-model pass.
+    Everything else rides the app-wide ORJSONResponse default.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+async def cache_set(key: str, data: dict, ttl: int) -> None:
+    """Store a JSON value in Redis with a TTL; failures are non-fatal."""
+    redis = getattr(app.state, "redis", None)
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(data), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
 # Create FastAPI app
 app = FastAPI(
     title="Legal Analysis SAAS",
     description="AI-powered legal document analysis platform with Indian Kanoon integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Response compression: CNR analysis payloads run 10-200 KB of JSON and
+# compress ~5-10x; small responses are left alone to avoid the CPU cost
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -67,38 +144,38 @@ app.add_middleware(
 
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
-    from src.database.database import health_check as db_health_check
-    from src.services.deepseek_service import get_deepseek_service
-    from src.services.kanoon_service import get_kanoon_client
+    state = request.app.state
+    cached = getattr(state, "health_cache", None)
+    if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
 
     health = {
         "status": "healthy",
-        "database": await db_health_check(),
         "timestamp": datetime.now()
     }
 
-    # Check DeepSeek API if configured
+    # Run all probes concurrently; each is independent I/O
+    probes = [("database", db_health_check())]
     if settings.deepseek_api_key:
-        try:
-            deepseek_service = await get_deepseek_service()
-            health["deepseek_api"] = await deepseek_service.test_connection()
-        except Exception as e:
-            logger.error(f"DeepSeek API health check failed: {e}")
-            health["deepseek_api"] = False
-
-    # Check Kanoon API if configured
+        probes.append(("deepseek_api", state.deepseek.test_connection()))
     if settings.indian_kanoon_api_key:
-        try:
-            kanoon_client = await get_kanoon_client()
-            # Simple test query
-            await kanoon_client.search_documents(query="test", maxpages=1)
-            health["kanoon_api"] = True
-        except Exception as e:
-            logger.error(f"Kanoon API health check failed: {e}")
-            health["kanoon_api"] = False
+        probes.append(("kanoon_api", state.kanoon.ping()))
+
+    results = await asyncio.gather(
+        *(probe for _, probe in probes),
+        return_exceptions=True
+    )
 
+    for (name, _), result in zip(probes, results):
+        if isinstance(result, Exception):
+            logger.error(f"{name} health check failed: {result}")
+            health[name] = False
+        else:
+            health[name] = bool(result)
+
+    state.health_cache = (time.monotonic(), health)
     return health
 
 
@@ -229,17 +306,15 @@ async def get_analysis(analysis_id: int, db=Depends(get_db)):
 
 # Kanoon search endpoints
 @app.post("/search/kanoon", response_model=SearchResponse)
-async def search_kanoon(search_query: SearchQuery):
+async def search_kanoon(search_query: SearchQuery, request: Request):
     """Search Indian Kanoon for legal documents."""
-    from src.services.kanoon_service import get_kanoon_client
-
     try:
-        kanoon_client = await get_kanoon_client()
+        kanoon_client = request.app.state.kanoon
         results = await kanoon_client.search_documents(
             query=search_query.query,
             doctypes=search_query.doctypes,
-            fromdate=search_query.fromdate,
-            todate=search_query.todate,
+            fromdate=search_query.fromdate.isoformat() if search_query.fromdate else None,
+            todate=search_query.todate.isoformat() if search_query.todate else None,
             title=search_query.title,
             cite=search_query.cite,
             author=search_query.author,
@@ -271,12 +346,10 @@ async def search_kanoon(search_query: SearchQuery):
 
 
 @app.get("/kanoon/documents/{doc_id}")
-async def get_kanoon_document(doc_id: str, maxcites: int = 10, maxcitedby: int = 10):
+async def get_kanoon_document(request: Request, doc_id: str, maxcites: int = 10, maxcitedby: int = 10):
     """Get a document from Indian Kanoon."""
-    from src.services.kanoon_service import get_kanoon_client
-
     try:
-        kanoon_client = await get_kanoon_client()
+        kanoon_client = request.app.state.kanoon
         document = await kanoon_client.get_document(
             doc_id=doc_id,
             maxcites=maxcites,
@@ -292,28 +365,30 @@ async def get_kanoon_document(doc_id: str, maxcites: int = 10, maxcitedby: int =
 
 
 @app.post("/analyze/cnr", response_model=CNRSearchResponse)
-async def analyze_by_cnr(cnr_request: CNRSearchRequest):
+async def analyze_by_cnr(cnr_request: CNRSearchRequest, request: Request):
     """
     Analyze a legal case by CNR (Case Number Record) number.
 
     Searches Indian Kanoon for documents with the given CNR,
     retrieves the document, and performs AI analysis.
     """
-    from src.services.kanoon_service import get_kanoon_client
-    from src.services.deepseek_service import get_deepseek_service
+    cache_key = f"cnr:analyze:{cnr_request.cnr_number}:{cnr_request.analysis_type}:{cnr_request.include_analysis}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return model_json_response(CNRSearchResponse.model_construct(**cached))
 
     try:
         # Step 1: Search for documents by CNR
-        kanoon_client = await get_kanoon_client()
+        kanoon_client = request.app.state.kanoon
         cnr_result = await kanoon_client.analyze_case_by_cnr(cnr_request.cnr_number)
 
         if not cnr_result.get('found'):
-            return CNRSearchResponse(
+            return model_json_response(CNRSearchResponse.model_construct(
                 cnr_number=cnr_request.cnr_number,
                 found=False,
                 error="No documents found for the given CNR number",
                 search_results_count=0
-            )
+            ))
 
         # Prepare base response
         response_data = {
@@ -332,7 +407,7 @@ async def analyze_by_cnr(cnr_request: CNRSearchRequest):
         # Step 2: Perform AI analysis if requested and document text is available
         if cnr_request.include_analysis and cnr_result.get('analysis_ready') and cnr_result.get('document_text'):
             try:
-                deepseek_service = await get_deepseek_service()
+                deepseek_service = request.app.state.deepseek
 
                 # Prepare context for analysis
                 context = {
@@ -358,7 +433,11 @@ async def analyze_by_cnr(cnr_request: CNRSearchRequest):
         elif cnr_request.include_analysis and not cnr_result.get('analysis_ready'):
             response_data['error'] = "Document found but text extraction failed for analysis"
 
-        return CNRSearchResponse(**response_data)
+        # Only cache clean results; errors should be retryable
+        if response_data.get('error') is None:
+            await cache_set(cache_key, response_data, CNR_ANALYSIS_CACHE_TTL)
+
+        return model_json_response(CNRSearchResponse.model_construct(**response_data))
 
     except Exception as e:
         logger.error(f"CNR analysis error for {cnr_request.cnr_number}: {e}")
@@ -369,37 +448,44 @@ async def analyze_by_cnr(cnr_request: CNRSearchRequest):
 
 
 @app.post("/search/cnr", response_model=CNRSearchResponse)
-async def search_by_cnr(cnr_request: CNRSearchRequest):
+async def search_by_cnr(cnr_request: CNRSearchRequest, request: Request):
     """
     Search for documents by CNR number without AI analysis.
     """
-    from src.services.kanoon_service import get_kanoon_client
+    cache_key = f"cnr:search:{cnr_request.cnr_number}:{cnr_request.include_analysis}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return model_json_response(CNRSearchResponse.model_construct(**cached))
 
     try:
-        kanoon_client = await get_kanoon_client()
+        kanoon_client = request.app.state.kanoon
         cnr_result = await kanoon_client.analyze_case_by_cnr(cnr_request.cnr_number)
 
         if not cnr_result.get('found'):
-            return CNRSearchResponse(
+            return model_json_response(CNRSearchResponse.model_construct(
                 cnr_number=cnr_request.cnr_number,
                 found=False,
                 error="No documents found for the given CNR number",
                 search_results_count=0
-            )
-
-        return CNRSearchResponse(
-            cnr_number=cnr_request.cnr_number,
-            found=True,
-            document_id=cnr_result.get('document_id'),
-            document_title=cnr_result.get('document_title'),
-            court=cnr_result.get('court'),
-            date=cnr_result.get('date'),
-            citation=cnr_result.get('citation'),
-            search_results_count=cnr_result.get('metadata', {}).get('search_results', 0),
-            document_text_preview=cnr_result.get('document_text', '')[:500] if cnr_result.get('document_text') else None,
-            metadata=cnr_result.get('metadata', {}),
-            analysis_type=None if not cnr_request.include_analysis else cnr_request.analysis_type
-        )
+            ))
+
+        response_data = {
+            'cnr_number': cnr_request.cnr_number,
+            'found': True,
+            'document_id': cnr_result.get('document_id'),
+            'document_title': cnr_result.get('document_title'),
+            'court': cnr_result.get('court'),
+            'date': cnr_result.get('date'),
+            'citation': cnr_result.get('citation'),
+            'search_results_count': cnr_result.get('metadata', {}).get('search_results', 0),
+            'document_text_preview': cnr_result.get('document_text', '')[:500] if cnr_result.get('document_text') else None,
+            'metadata': cnr_result.get('metadata', {}),
+            'analysis_type': None if not cnr_request.include_analysis else cnr_request.analysis_type
+        }
+
+        await cache_set(cache_key, response_data, CNR_SEARCH_CACHE_TTL)
+
+        return model_json_response(CNRSearchResponse.model_construct(**response_data))
 
     except Exception as e:
         logger.error(f"CNR search error for {cnr_request.cnr_number}: {e}")
@@ -417,8 +503,6 @@ async def process_file(
     page_limit: int = 50
 ):
     """Process a file (OCR, text extraction)."""
-    from src.services.document_processor import get_document_processor
-
     try:
         processor = await get_document_processor()
         result = await processor.process_uploaded_file(
@@ -447,13 +531,12 @@ async def process_file(
 # AI analysis endpoint
 @app.post("/analyze/document")
 async def analyze_document(
+    request: Request,
     document_text: str,
     analysis_type: str = "document_summary",
     context: Optional[dict] = None
 ):
     """Analyze a document using DeepSeek AI."""
-    from src.services.deepseek_service import get_deepseek_service
-
     if not settings.deepseek_api_key:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -461,7 +544,7 @@ async def analyze_document(
         )
 
     try:
-        deepseek_service = await get_deepseek_service()
+        deepseek_service = request.app.state.deepseek
         result = await deepseek_service.analyze_document(
             document_text=document_text,
             analysis_type=analysis_type,
@@ -492,7 +575,3 @@ async def root():
             "analysis": "/analyze/document"
         }
     }
-
-
-# Import datetime for health check
-from datetime import datetime
\ No newline at end of file
@@ -2,51 +2,59 @@
 Pydantic models for API requests and responses.
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from enum import Enum
-
-
-# Enums
-class UserRole(str, Enum):
-    ADMIN = "admin"
-    LAWYER = "lawyer"
-    PARALEGAL = "paralegal"
-    CLIENT = "client"
-    RESEARCHER = "researcher"
-
-
-class CaseStatus(str, Enum):
-    DRAFT = "draft"
-    ACTIVE = "active"
-    CLOSED = "closed"
-    ARCHIVED = "archived"
-
-
-class DocumentType(str, Enum):
-    PLEADING = "pleading"
-    AFFIDAVIT = "affidavit"
-    ORDER = "order"
-    JUDGMENT = "judgment"
-    EVIDENCE = "evidence"
-    CONTRACT = "contract"
-    CORRESPONDENCE = "correspondence"
-    OTHER = "other"
-
-
-class AnalysisType(str, Enum):
-    DOCUMENT_SUMMARY = "document_summary"
-    RISK_ASSESSMENT = "risk_assessment"
-    CASE_ANALYSIS = "case_analysis"
-    DOCUMENT_REVIEW = "document_review"
-    LEGAL_ARGUMENTS = "legal_arguments"
-    OUTCOME_PREDICTION = "outcome_prediction"
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, SkipValidation, StringConstraints, TypeAdapter, validator
+from typing import Annotated, Optional, List, Dict, Any
+
+# pydantic requires typing_extensions.TypedDict on Python < 3.12 to
+# build response adapters (typing.TypedDict lacks the needed hooks)
+from typing_extensions import TypedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from src.common.enums import AnalysisType, CaseStatus, DocumentType, UserRole
+
+# JSON blobs produced by our own services (or already JSON-parsed by the
+# Kanoon/DeepSeek clients); re-walking them value-by-value in pydantic
+# buys nothing, so validation is skipped on pass-through dict fields.
+JSONBlob = Annotated[Dict[str, Any], SkipValidation]
+
+# Lightweight email check. EmailStr drags in email-validator (IDNA
+# tables and all) at import and builds a heavyweight core schema; a
+# compiled pattern is enough for routine signup/login paths. Use
+# EmailStr explicitly on any endpoint that needs strict RFC validation.
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[
+    str,
+    StringConstraints(pattern=EMAIL_RE, max_length=254, strip_whitespace=True, to_lower=True),
+]
+
+# Rows read back from Postgres were validated on write; set False to
+# force full validation when debugging suspect data.
+TRUSTED_DB_BUILD = True
+
+
+class FastFromORM:
+    """
+    Mixin for response models hydrated from trusted ORM rows.
+
+    from_orm_fast skips pydantic validation via model_construct, which
+    removes the dominant per-item CPU cost in list endpoints. Never use
+    it for client-supplied input — *Create/*Update models keep full
+    validation.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, orm_obj):
+        if not TRUSTED_DB_BUILD:
+            return cls.model_validate(orm_obj)
+        return cls.model_construct(
+            **{name: getattr(orm_obj, name, None) for name in cls.model_fields}
+        )
 
 
 # User models
 class UserBase(BaseModel):
-    email: EmailStr
+    email: Email
     full_name: str = Field(..., min_length=1, max_length=255)
     role: UserRole = UserRole.CLIENT
 
@@ -60,15 +68,14 @@ class UserUpdate(BaseModel):
     role: Optional[UserRole] = None
 
 
-class UserResponse(UserBase):
+class UserResponse(FastFromORM, UserBase):
     id: int
     is_active: bool
     is_verified: bool
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, extra="ignore")
 
 
 # Authentication models
@@ -77,10 +84,12 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
-class TokenData(BaseModel):
-    user_id: Optional[int] = None
-    email: Optional[str] = None
-    role: Optional[UserRole] = None
+class TokenData(TypedDict, total=False):
+    # Internal container decoded from our own JWTs; a TypedDict avoids
+    # pydantic validator frames on every authenticated request.
+    user_id: int
+    email: str
+    role: UserRole
 
 
 # Team models
@@ -93,13 +102,12 @@ class TeamCreate(TeamBase):
     pass
 
 
-class TeamResponse(TeamBase):
+class TeamResponse(FastFromORM, TeamBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, extra="ignore")
 
 
 class TeamMemberCreate(BaseModel):
@@ -135,7 +143,7 @@ class CaseUpdate(BaseModel):
     hearing_date: Optional[datetime] = None
 
 
-class CaseResponse(CaseBase):
+class CaseResponse(FastFromORM, CaseBase):
     id: int
     user_id: int
     team_id: Optional[int]
@@ -143,8 +151,7 @@ class CaseResponse(CaseBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, extra="ignore")
 
 
 # Document models
@@ -161,7 +168,7 @@ class DocumentCreate(DocumentBase):
     mime_type: str = Field(..., min_length=1, max_length=100)
 
 
-class DocumentResponse(DocumentBase):
+class DocumentResponse(FastFromORM, DocumentBase):
     id: int
     case_id: int
     filename: str
@@ -170,7 +177,8 @@ class DocumentResponse(DocumentBase):
     storage_path: str
     storage_provider: str
     page_count: Optional[int]
-    extracted_text: Optional[str]
+    # None unless the row was loaded with undefer(Document.extracted_text)
+    extracted_text: Optional[str] = None
     ocr_used: bool
     is_processed: bool
     kanoon_doc_id: Optional[str]
@@ -178,8 +186,7 @@ class DocumentResponse(DocumentBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, extra="ignore")
 
 
 # Analysis models
@@ -192,14 +199,14 @@ class AnalysisCreate(AnalysisBase):
     prompt_customization: Optional[Dict[str, Any]] = None
 
 
-class AnalysisResponse(AnalysisBase):
+class AnalysisResponse(FastFromORM, AnalysisBase):
     id: int
     case_id: int
     user_id: int
     status: str
     model_used: Optional[str]
     model_version: Optional[str]
-    analysis_result: Optional[Dict[str, Any]]
+    analysis_result: Optional[JSONBlob]
     processing_time_ms: Optional[int]
     token_count: Optional[int]
     cost_estimate: Optional[float]
@@ -209,16 +216,17 @@ class AnalysisResponse(AnalysisBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, extra="ignore")
 
 
 # Search models
 class SearchQuery(BaseModel):
     query: str = Field(..., min_length=1)
     doctypes: Optional[List[str]] = None
-    fromdate: Optional[str] = Field(None, pattern=r"^\d{4}-\d{2}-\d{2}$")
-    todate: Optional[str] = Field(None, pattern=r"^\d{4}-\d{2}-\d{2}$")
+    # Parsed by pydantic-core's native ISO-8601 date parser, which is
+    # faster than the regex pattern these fields previously carried.
+    fromdate: Optional[date] = None
+    todate: Optional[date] = None
     title: Optional[str] = None
     cite: Optional[str] = None
     author: Optional[str] = None
@@ -231,8 +239,8 @@ class SearchResponse(BaseModel):
     query: str
     total_results: int
     page: int
-    results: List[Dict[str, Any]]
-    filters: Optional[Dict[str, Any]] = None
+    results: Annotated[List[Dict[str, Any]], SkipValidation]
+    filters: Optional[JSONBlob] = None
 
 
 # Kanoon models
@@ -260,35 +268,37 @@ class CNRSearchResponse(BaseModel):
     citation: Optional[str] = None
     search_results_count: int = 0
     document_text_preview: Optional[str] = None
-    analysis_result: Optional[Dict[str, Any]] = None
+    analysis_result: Optional[JSONBlob] = None
     analysis_type: Optional[str] = None
     error: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JSONBlob] = None
 
 
 class KanoonBatchSearchRequest(BaseModel):
     queries: List[str] = Field(..., min_items=1, max_items=10)
-    filters: Optional[Dict[str, Any]] = None
+    filters: Optional[JSONBlob] = None
     limit_per_query: int = Field(default=10, ge=1, le=50)
 
 
-# File upload models
-class FileUploadResponse(BaseModel):
+# File upload models. Built from our own processing result, so a slotted
+# dataclass is enough; FastAPI still documents and serializes it.
+@dataclass(slots=True)
+class FileUploadResponse:
     filename: str
     file_size: int
     mime_type: str
-    processing_result: Dict[str, Any]
+    processing_result: JSONBlob
     success: bool
     error: Optional[str] = None
 
 
-# Health check
-class HealthResponse(BaseModel):
+# Health check payload assembled in the handler from probe results.
+class HealthResponse(TypedDict, total=False):
     status: str
     database: bool
-    redis: Optional[bool] = None
-    deepseek_api: Optional[bool] = None
-    kanoon_api: Optional[bool] = None
+    redis: bool
+    deepseek_api: bool
+    kanoon_api: bool
     timestamp: datetime
 
 
@@ -298,9 +308,20 @@ class PaginationParams(BaseModel):
     per_page: int = Field(default=20, ge=1, le=100)
 
 
-class PaginatedResponse(BaseModel):
+@dataclass(slots=True)
+class PaginatedResponse:
     items: List[Any]
     total: int
     page: int
     per_page: int
-    total_pages: int
\ No newline at end of file
+    total_pages: int
+
+
+# Pre-built list adapters for bulk read endpoints. Building a TypeAdapter
+# costs a full pydantic-core schema construction, so they are created once
+# at import time; handlers serialize with e.g.
+# CASE_LIST_ADAPTER.dump_json(rows) into a plain Response.
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+CASE_LIST_ADAPTER = TypeAdapter(List[CaseResponse])
+DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentResponse])
+ANALYSIS_LIST_ADAPTER = TypeAdapter(List[AnalysisResponse])
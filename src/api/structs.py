@@ -0,0 +1,108 @@
+"""
+msgspec mirrors of the hot read-path response models.
+
+FastAPI's default path (Pydantic validation + jsonable_encoder) is the
+bulk of response overhead for list-style read endpoints. These structs
+encode through msgspec's C encoder instead; use them when a handler only
+needs to emit JSON from trusted data (DB rows, service results) and keep
+the Pydantic models in src/api/models.py for request validation and for
+OpenAPI schemas.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import msgspec
+from fastapi import Response
+
+
+class UserResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    email: str
+    full_name: str
+    role: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class CaseResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    user_id: int
+    title: str
+    status: str
+    created_at: datetime
+    team_id: Optional[int] = None
+    case_number: Optional[str] = None
+    court_name: Optional[str] = None
+    jurisdiction: Optional[str] = None
+    plaintiff: Optional[str] = None
+    defendant: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = []
+    filing_date: Optional[datetime] = None
+    hearing_date: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class DocumentResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    case_id: int
+    title: str
+    filename: str
+    file_size: int
+    file_type: str
+    mime_type: str
+    storage_path: str
+    storage_provider: str
+    ocr_used: bool
+    is_processed: bool
+    created_at: datetime
+    page_count: Optional[int] = None
+    extracted_text: Optional[str] = None
+    kanoon_doc_id: Optional[str] = None
+    kanoon_citation: Optional[str] = None
+    document_date: Optional[datetime] = None
+    author: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+class AnalysisResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    case_id: int
+    user_id: int
+    analysis_type: str
+    status: str
+    created_at: datetime
+    document_id: Optional[int] = None
+    model_used: Optional[str] = None
+    model_version: Optional[str] = None
+    analysis_result: Optional[Dict[str, Any]] = None
+    processing_time_ms: Optional[int] = None
+    token_count: Optional[int] = None
+    cost_estimate: Optional[float] = None
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+def from_orm(struct_cls, orm_obj):
+    """
+    Build a struct from an ORM row by plain attribute copy.
+
+    Rows read back from Postgres were validated on write, so no
+    per-field validation is needed here.
+    """
+    return struct_cls(
+        **{field: getattr(orm_obj, field, None) for field in struct_cls.__struct_fields__}
+    )
+
+
+def struct_json_response(content) -> Response:
+    """
+    Encode a struct (or list of structs) with msgspec and return it as a
+    ready-made Response, bypassing jsonable_encoder entirely.
+    """
+    return Response(content=msgspec.json.encode(content), media_type="application/json")
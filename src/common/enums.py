@@ -0,0 +1,57 @@
+"""
+Canonical enums shared between the API and database layers.
+
+Both layers previously defined parallel copies of these enums, doubling
+schema-build work at import and forcing value translation when rows flow
+from the ORM into response models. SQLAlchemy's Enum() column type and
+Pydantic fields both accept these classes directly.
+"""
+
+import enum
+
+
+class UserRole(str, enum.Enum):
+    """User roles in the system."""
+    ADMIN = "admin"
+    LAWYER = "lawyer"
+    PARALEGAL = "paralegal"
+    CLIENT = "client"
+    RESEARCHER = "researcher"
+
+
+class CaseStatus(str, enum.Enum):
+    """Case status enumeration."""
+    DRAFT = "draft"
+    ACTIVE = "active"
+    CLOSED = "closed"
+    ARCHIVED = "archived"
+
+
+class DocumentType(str, enum.Enum):
+    """Document type enumeration."""
+    PLEADING = "pleading"
+    AFFIDAVIT = "affidavit"
+    ORDER = "order"
+    JUDGMENT = "judgment"
+    EVIDENCE = "evidence"
+    CONTRACT = "contract"
+    CORRESPONDENCE = "correspondence"
+    OTHER = "other"
+
+
+class AnalysisStatus(str, enum.Enum):
+    """Analysis status enumeration."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AnalysisType(str, enum.Enum):
+    """Types of AI analysis offered."""
+    DOCUMENT_SUMMARY = "document_summary"
+    RISK_ASSESSMENT = "risk_assessment"
+    CASE_ANALYSIS = "case_analysis"
+    DOCUMENT_REVIEW = "document_review"
+    LEGAL_ARGUMENTS = "legal_arguments"
+    OUTCOME_PREDICTION = "outcome_prediction"
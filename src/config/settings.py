@@ -2,7 +2,10 @@
 Application configuration settings using Pydantic Settings.
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from types import SimpleNamespace
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, PostgresDsn, RedisDsn
 from typing import Optional, List
 
@@ -16,6 +19,15 @@ class Settings(BaseSettings):
         env="DATABASE_URL"
     )
 
+    db_pool_size: int = Field(
+        default=10,
+        env="DB_POOL_SIZE"
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        env="DB_MAX_OVERFLOW"
+    )
+
     # Redis configuration
     redis_url: RedisDsn = Field(
         default="redis://localhost:6379/0",
@@ -31,6 +43,14 @@ class Settings(BaseSettings):
         default="https://api.deepseek.com",
         env="DEEPSEEK_BASE_URL"
     )
+    deepseek_requests_per_minute: int = Field(
+        default=60,
+        env="DEEPSEEK_REQUESTS_PER_MINUTE"
+    )
+    deepseek_tokens_per_minute: int = Field(
+        default=200_000,
+        env="DEEPSEEK_TOKENS_PER_MINUTE"
+    )
 
     # Indian Kanoon API
     indian_kanoon_api_key: str = Field(
@@ -41,6 +61,10 @@ class Settings(BaseSettings):
         default="https://api.indiankanoon.org",
         env="INDIAN_KANOON_BASE_URL"
     )
+    kanoon_requests_per_second: float = Field(
+        default=5.0,
+        env="KANOON_REQUESTS_PER_SECOND"
+    )
 
     # JWT Configuration
     jwt_secret_key: str = Field(
@@ -107,6 +131,20 @@ class Settings(BaseSettings):
         default=True,
         env="OCR_ENABLED"
     )
+    ocr_dpi: int = Field(
+        default=200,
+        env="OCR_DPI"
+    )
+    ocr_backend: str = Field(
+        default="tesseract",  # "tesseract", "paddle" (requires paddleocr) or "easyocr" (requires easyocr)
+        env="OCR_BACKEND"
+    )
+
+    # Cache Configuration
+    cache_dir: str = Field(
+        default=".cache",
+        env="CACHE_DIR"
+    )
 
     # Email Configuration
     smtp_host: Optional[str] = Field(
@@ -126,10 +164,41 @@ class Settings(BaseSettings):
         env="SMTP_PASSWORD"
     )
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(frozen=True, env_file=".env", case_sensitive=False)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings instance on first use (reads .env once)."""
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_settings_snapshot() -> SimpleNamespace:
+    """
+    Plain-namespace snapshot of the (frozen) settings for hot paths;
+    attribute lookup is a direct dict hit with no pydantic machinery.
+    """
+    built = get_settings()
+    return SimpleNamespace(**{name: getattr(built, name) for name in built.model_fields})
+
+
+class _LazySettings:
+    """
+    Proxy that defers Settings construction until the first attribute
+    access, keeping env-file parsing and model validation off the
+    import path walked at startup. Settings is frozen, so values read
+    through the proxy are memoized on the proxy itself — repeat reads
+    of hot keys (DB URL, JWT secret) skip pydantic's descriptor path.
+    Existing `from src.config.settings import settings` call sites keep
+    working.
+    """
+
+    def __getattr__(self, name):
+        value = getattr(get_settings_snapshot(), name)
+        object.__setattr__(self, name, value)
+        return value
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+# Global settings instance (lazily constructed)
+settings = _LazySettings()
\ No newline at end of file
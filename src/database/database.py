@@ -2,23 +2,31 @@
 Database connection and session management.
 """
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
 from typing import AsyncGenerator
 import logging
+import time
 
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Create async engine
+# Create async engine. Connections are pooled even in debug mode:
+# NullPool forced a fresh TCP/TLS/startup handshake per request, which
+# dominates latency for short queries.
 engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
-    poolclass=NullPool if settings.debug else None,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
     pool_recycle=3600,
+    # LIFO keeps recently-used connections hot; rollback-on-return stops
+    # connections sitting idle-in-transaction holding locks.
+    pool_use_lifo=True,
+    pool_reset_on_return="rollback",
 )
 
 # Create async session factory
@@ -47,6 +55,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _audit_partition_ddl(months_ahead: int = 2):
+    """
+    DDL for monthly audit_logs partitions covering the current month
+    through `months_ahead` months out. audit_logs is partitioned by
+    RANGE (created_at); inserts fail without a covering partition.
+    """
+    from datetime import date
+
+    today = date.today()
+    statements = []
+    year, month = today.year, today.month
+    for _ in range(months_ahead + 1):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        statements.append(text(
+            f"CREATE TABLE IF NOT EXISTS audit_logs_{year}{month:02d} "
+            f"PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')"
+        ))
+        year, month = next_year, next_month
+    return statements
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
@@ -57,6 +87,8 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
+        for stmt in _audit_partition_ddl():
+            await conn.execute(stmt)
 
     logger.info("Database tables created successfully")
 
@@ -96,18 +128,36 @@ async def execute_in_transaction(session: AsyncSession, func, *args, **kwargs):
         raise
 
 
+# Prepared once; readiness probes hit this every few seconds, so skip
+# session/transaction setup and reuse a pooled connection instead.
+_HEALTH_STMT = text("SELECT 1")
+_HEALTH_CACHE_TTL = 5.0
+_health_cache = (0.0, False)
+
+
 async def health_check() -> bool:
     """
     Check database connection health.
 
+    The result is cached for a few seconds so bursts of probe traffic
+    don't each round-trip to Postgres.
+
     Returns:
         bool: True if database is healthy
     """
+    global _health_cache
+    checked_at, healthy = _health_cache
+    now = time.monotonic()
+    if now - checked_at < _HEALTH_CACHE_TTL:
+        return healthy
+
     try:
-        async with AsyncSessionLocal() as session:
-            # Execute a simple query
-            await session.execute("SELECT 1")
-        return True
+        async with engine.connect() as conn:
+            await conn.execute(_HEALTH_STMT)
+        healthy = True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        return False
\ No newline at end of file
+        healthy = False
+
+    _health_cache = (now, healthy)
+    return healthy
\ No newline at end of file
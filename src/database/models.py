@@ -3,52 +3,46 @@ SQLAlchemy models for the legal analysis SAAS.
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean,
-    ForeignKey, Float, JSON, Enum, LargeBinary
+    Column, Integer, String, Text, DateTime, Boolean, CheckConstraint,
+    ForeignKey, Float, Index, Enum, LargeBinary, TypeDecorator
 )
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import text
+from sqlalchemy.orm import relationship, declarative_base, deferred
 from sqlalchemy.sql import func
-import enum
 from datetime import datetime
+import sys
 
-Base = declarative_base()
-
+from src.common.enums import (
+    AnalysisStatus, AnalysisType, CaseStatus, DocumentType, UserRole
+)
 
-class UserRole(str, enum.Enum):
-    """User roles in the system."""
-    ADMIN = "admin"
-    LAWYER = "lawyer"
-    PARALEGAL = "paralegal"
-    CLIENT = "client"
-    RESEARCHER = "researcher"
+Base = declarative_base()
 
 
-class CaseStatus(str, enum.Enum):
-    """Case status enumeration."""
-    DRAFT = "draft"
-    ACTIVE = "active"
-    CLOSED = "closed"
-    ARCHIVED = "archived"
+class InternedString(TypeDecorator):
+    """
+    String column whose values are drawn from a small fixed set
+    (providers, mime types, member roles). Interning on read means all
+    rows share one Python object per distinct value instead of
+    allocating a fresh string each.
+    """
 
+    impl = String
+    cache_ok = True
 
-class DocumentType(str, enum.Enum):
-    """Document type enumeration."""
-    PLEADING = "pleading"
-    AFFIDAVIT = "affidavit"
-    ORDER = "order"
-    JUDGMENT = "judgment"
-    EVIDENCE = "evidence"
-    CONTRACT = "contract"
-    CORRESPONDENCE = "correspondence"
-    OTHER = "other"
+    def process_result_value(self, value, dialect):
+        return sys.intern(value) if value is not None else None
 
 
-class AnalysisStatus(str, enum.Enum):
-    """Analysis status enumeration."""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+# Shared column-type instances: each Enum(...) call re-inspects the
+# members and emits its own DDL object. native_enum=False stores plain
+# VARCHAR with a CHECK constraint, avoiding Postgres CREATE TYPE churn
+# on init_db.
+USER_ROLE_COL = Enum(UserRole, native_enum=False, length=20, validate_strings=True)
+CASE_STATUS_COL = Enum(CaseStatus, native_enum=False, length=20, validate_strings=True)
+DOCUMENT_TYPE_COL = Enum(DocumentType, native_enum=False, length=20, validate_strings=True)
+ANALYSIS_STATUS_COL = Enum(AnalysisStatus, native_enum=False, length=20, validate_strings=True)
 
 
 class User(Base):
@@ -59,7 +53,7 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     full_name = Column(String(255), nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.CLIENT)
+    role = Column(USER_ROLE_COL, default=UserRole.CLIENT)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -94,7 +88,7 @@ class TeamMember(Base):
     id = Column(Integer, primary_key=True, index=True)
     team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    role = Column(String(50), default="member")  # owner, admin, member
+    role = Column(InternedString(20), default="member")  # owner, admin, member
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -105,6 +99,14 @@ class TeamMember(Base):
 class Case(Base):
     """Legal case model."""
     __tablename__ = "cases"
+    # List endpoints filter by owner/team and status; composite indexes
+    # turn those into index-range scans instead of seq-scan + sort.
+    __table_args__ = (
+        Index("ix_case_user_status", "user_id", "status"),
+        Index("ix_case_team_status", "team_id", "status"),
+        # GIN index serves tag containment filters (tags @> '["x"]')
+        Index("ix_case_tags_gin", "tags", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -121,13 +123,15 @@ class Case(Base):
     defendant = Column(String(255), nullable=True)
 
     # Status and dates
-    status = Column(Enum(CaseStatus), default=CaseStatus.DRAFT)
+    status = Column(CASE_STATUS_COL, default=CaseStatus.DRAFT)
     filing_date = Column(DateTime(timezone=True), nullable=True)
     hearing_date = Column(DateTime(timezone=True), nullable=True)
 
     # Description and tags
     description = Column(Text, nullable=True)
-    tags = Column(JSON, default=[])  # List of tag strings
+    # default must be the list *callable* — a literal [] is one shared
+    # object aliased across every new row
+    tags = Column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -143,6 +147,11 @@ class Case(Base):
 class Document(Base):
     """Legal document model."""
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_doc_case_created", "case_id", "created_at"),
+        CheckConstraint("storage_provider IN ('s3', 'local', 'kanoon')",
+                        name="ck_doc_storage_provider"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     case_id = Column(Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False)
@@ -151,16 +160,18 @@ class Document(Base):
     title = Column(String(500), nullable=False)
     filename = Column(String(255), nullable=False)
     file_size = Column(Integer, nullable=False)  # Size in bytes
-    file_type = Column(Enum(DocumentType), default=DocumentType.OTHER)
-    mime_type = Column(String(100), nullable=False)
+    file_type = Column(DOCUMENT_TYPE_COL, default=DocumentType.OTHER)
+    mime_type = Column(InternedString(100), nullable=False)
 
     # Storage information
     storage_path = Column(String(500), nullable=False)  # S3 path or local path
-    storage_provider = Column(String(50), default="s3")  # s3, local, kanoon
+    storage_provider = Column(InternedString(20), default="s3")  # s3, local, kanoon
 
     # Content information
     page_count = Column(Integer, nullable=True)
-    extracted_text = Column(Text, nullable=True)
+    # Deferred: OCR payloads run to megabytes and list endpoints must not
+    # drag them over the wire; undefer explicitly for full-text reads.
+    extracted_text = deferred(Column(Text, nullable=True))
     ocr_used = Column(Boolean, default=False)
 
     # Source information (if from Kanoon API)
@@ -188,6 +199,10 @@ class Document(Base):
 class Analysis(Base):
     """AI analysis of a document or case."""
     __tablename__ = "analyses"
+    __table_args__ = (
+        Index("ix_an_case_type", "case_id", "analysis_type"),
+        Index("ix_an_user_status", "user_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     case_id = Column(Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False)
@@ -196,7 +211,7 @@ class Analysis(Base):
 
     # Analysis metadata
     analysis_type = Column(String(100), nullable=False)  # summary, risk, strategy, etc.
-    status = Column(Enum(AnalysisStatus), default=AnalysisStatus.PENDING)
+    status = Column(ANALYSIS_STATUS_COL, default=AnalysisStatus.PENDING)
 
     # AI model information
     model_used = Column(String(100), nullable=True)
@@ -204,7 +219,7 @@ class Analysis(Base):
 
     # Analysis content
     prompt_used = Column(Text, nullable=True)
-    analysis_result = Column(JSON, nullable=True)  # Structured JSON result
+    analysis_result = Column(JSONB, nullable=True)  # Structured JSON result
     raw_response = Column(Text, nullable=True)  # Raw AI response
 
     # Metrics
@@ -237,11 +252,11 @@ class SearchQuery(Base):
 
     # Query information
     query_text = Column(Text, nullable=False)
-    filters = Column(JSON, nullable=True)  # JSON object with filters
+    filters = Column(JSONB, nullable=True)  # JSON object with filters
 
     # Results
     result_count = Column(Integer, nullable=True)
-    results = Column(JSON, nullable=True)  # First page results
+    results = Column(JSONB, nullable=True)  # First page results
 
     # Kanoon API information
     kanoon_request_id = Column(String(100), nullable=True)
@@ -267,7 +282,7 @@ class APIKey(Base):
     secret = Column(String(255), nullable=False)  # Hashed secret
 
     # Permissions
-    scopes = Column(JSON, default=[])  # List of allowed scopes
+    scopes = Column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))  # Allowed scopes
 
     # Status
     is_active = Column(Boolean, default=True)
@@ -287,8 +302,20 @@ class APIKey(Base):
 class AuditLog(Base):
     """Audit log for security and compliance."""
     __tablename__ = "audit_logs"
-
-    id = Column(Integer, primary_key=True, index=True)
+    # Append-only and unbounded: range-partitioned by month so time-range
+    # queries prune to one partition and VACUUM stays cheap. init_db
+    # creates partitions for the current and next two months. The
+    # indexes below are created per-partition by Postgres.
+    __table_args__ = (
+        Index("ix_audit_user_created", "user_id", "created_at"),
+        Index("ix_audit_resource", "resource_type", "resource_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # autoincrement must be explicit here: SQLAlchemy only infers
+    # SERIAL for single-column integer PKs, and the partition key makes
+    # this PK composite
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Action information
@@ -297,9 +324,25 @@ class AuditLog(Base):
     resource_id = Column(String(100), nullable=True)
 
     # Details
-    details = Column(JSON, nullable=True)
+    details = Column(JSONB, nullable=True)
     ip_address = Column(String(45), nullable=True)  # Supports IPv6
     user_agent = Column(Text, nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    # Part of the primary key: Postgres requires the partition key in
+    # every unique constraint on a partitioned table.
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+
+
+# Standard eager-load option sets. Default lazy loading turns "case with
+# its documents" into N+1 queries; selectinload batches the children in
+# one WHERE ... IN (...) query. List/detail endpoints that serialize
+# relationships should pass these to Query.options().
+from sqlalchemy.orm import selectinload, undefer  # noqa: E402
+
+CASE_WITH_DOCUMENTS = selectinload(Case.documents)
+DOCUMENT_WITH_TEXT = undefer(Document.extracted_text)
+DOCUMENT_WITH_ANALYSES = selectinload(Document.analyses)
+CASE_FULL = (
+    selectinload(Case.documents).selectinload(Document.analyses),
+    selectinload(Case.analyses),
+)
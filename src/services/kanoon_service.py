@@ -2,9 +2,17 @@
 Indian Kanoon API integration service.
 """
 
+import asyncio
+import functools
+import time
+import operator
+import hashlib
+import random
+import zlib
+
 import httpx
-import json
 import logging
+import orjson
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from urllib.parse import urlencode
@@ -13,6 +21,189 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Transient statuses worth retrying; everything else fails fast
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Pattern tables built once at import; search_by_cnr and citation-query
+# generation run per-document during bulk ingest, so per-call f-string
+# list building adds up. CNR numbers appear in documents in several
+# formats — each template covers one.
+_CNR_PATTERNS = (
+    '"{c}"',                       # Exact CNR
+    'CNR {c}',                     # CNR with space
+    'CNR NO: {c}',                 # Common format
+    'CNR NO.{c}',                  # Alternative format
+    'CNR NO {c}',                  # Without punctuation
+    'Case Number Record: {c}',     # Full phrase
+)
+
+_CITATION_PATTERNS = (
+    '"{y}" AND "AIR"',
+    '"{y}" AND "SCC"',
+    '"{y}" AND "SCR"',
+)
+
+# parse_search_result field tables: raw Kanoon keys, the names we expose,
+# and a bound itemgetter so complete rows (the common case) are pulled in
+# one C-level call instead of eleven dict.get frames each
+_RAW_RESULT_KEYS = ('tid', 'title', 'cite', 'court', 'date', 'author',
+                    'bench', 'size', 'snippet', 'score', 'type')
+_PARSED_RESULT_KEYS = ('id', 'title', 'citation', 'court', 'date', 'author',
+                       'bench', 'size', 'snippet', 'score', 'type')
+_RESULT_GETTER = operator.itemgetter(*_RAW_RESULT_KEYS)
+_RESULT_DEFAULTS = {'size': 0, 'score': 0}
+
+# Document-text field candidates in priority order; which one carries
+# the body depends on the Kanoon document type
+_TEXT_KEYS = ('text', 'content', 'judgment', 'description')
+
+# Kanoon is a paid, rate-limited API and identical lookups recur across
+# tenants; cached responses skip both the latency and the quota charge.
+CACHE_TTL = 3600
+
+_redis = None
+
+# Single-flight registry: concurrent callers asking for the same key
+# share one in-flight request instead of firing duplicate POSTs (the
+# Redis cache cannot help before the first response lands)
+_inflight: Dict[str, "asyncio.Future"] = {}
+
+
+def _get_redis():
+    """Lazily create the shared Redis connection for response caching."""
+    global _redis
+    if _redis is None:
+        import redis.asyncio as aioredis
+        _redis = aioredis.from_url(str(settings.redis_url))
+    return _redis
+
+
+def redis_memoize(ttl: int = CACHE_TTL):
+    """
+    Memoize an async client method in Redis.
+
+    The key hashes the canonicalized arguments; values are compressed
+    JSON (search payloads compress ~5x). Redis failures degrade to a
+    plain call — the cache is never load-bearing.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            digest = hashlib.sha1(
+                orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            key = f"kanoon:{fn.__name__}:{digest}"
+            try:
+                cached = await _get_redis().get(key)
+                if cached is not None:
+                    return orjson.loads(zlib.decompress(cached))
+            except Exception as e:
+                logger.warning(f"Kanoon cache read failed for {key}: {e}")
+
+            existing = _inflight.get(key)
+            if existing is not None:
+                try:
+                    return await asyncio.shield(existing)
+                except asyncio.CancelledError:
+                    # If the leader (not us) was cancelled, fall through
+                    # and compute the result ourselves
+                    if not existing.cancelled():
+                        raise
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+
+            try:
+                result = await fn(self, *args, **kwargs)
+                future.set_result(result)
+            except BaseException as e:
+                # The future must be settled before it leaves _inflight,
+                # or waiters parked on it hang forever. Leader
+                # cancellation (e.g. search_by_cnr cancelling surplus
+                # tasks) cancels the future so waiters can take over.
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # mark retrieved; waiters re-raise themselves
+                raise
+            finally:
+                _inflight.pop(key, None)
+            try:
+                await _get_redis().setex(
+                    key, ttl, zlib.compress(orjson.dumps(result))
+                )
+            except Exception as e:
+                logger.warning(f"Kanoon cache write failed for {key}: {e}")
+            return result
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_headers() -> Dict[str, str]:
+    """
+    Build the request headers once per process.
+
+    Deferred behind lru_cache (not a module-level literal) so importing
+    this module doesn't force settings construction; repeated client
+    creations under tests share the same dict. The Authorization header
+    is omitted entirely when no key is configured — servers may choke on
+    an empty Token value.
+    """
+    headers = {"Accept": "application/json"}
+    if settings.indian_kanoon_api_key:
+        headers["Authorization"] = f"Token {settings.indian_kanoon_api_key}"
+    return headers
+
+
+class _AdaptiveRateLimiter:
+    """
+    Token bucket pacing requests per second, with multiplicative backoff.
+
+    A 429 from Kanoon halves the effective rate; after a cool-off window
+    with no further 429s the configured rate is restored. This keeps the
+    concurrent batch/CNR gathers from burning quota on rejected calls
+    without resorting to fixed sleeps.
+    """
+
+    COOL_OFF = 30.0  # seconds without a 429 before the rate recovers
+    MIN_RATE = 0.5
+
+    def __init__(self, rate: float):
+        self.configured_rate = rate
+        self.rate = rate
+        self._allowance = rate
+        self._last_check = time.monotonic()
+        self._backoff_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate < self.configured_rate and now >= self._backoff_until:
+            logger.info(f"Kanoon rate limit recovered to {self.configured_rate}/s")
+            self.rate = self.configured_rate
+        self._allowance = min(
+            self.rate, self._allowance + (now - self._last_check) * self.rate
+        )
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        """Block until a request slot is available."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._allowance >= 1.0:
+                    self._allowance -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._allowance) / self.rate)
+
+    def backoff(self) -> None:
+        """Halve the rate in response to a 429."""
+        self.rate = max(self.MIN_RATE, self.rate / 2)
+        self._allowance = min(self._allowance, self.rate)
+        self._backoff_until = time.monotonic() + self.COOL_OFF
+        logger.warning(f"Kanoon 429 received, throttling to {self.rate:.1f} req/s")
+
 
 class IndianKanoonClient:
     """Client for Indian Kanoon API."""
@@ -20,15 +211,112 @@ class IndianKanoonClient:
     def __init__(self):
         self.base_url = settings.indian_kanoon_base_url
         self.api_key = settings.indian_kanoon_api_key
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "Accept": "application/json",
-                "Authorization": f"Token {self.api_key}" if self.api_key else ""
-            }
-        )
+        # The httpx client is created lazily on first request: eager
+        # construction grabs an event loop and file descriptors even in
+        # processes (Celery workers, tests) that import but never call
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        # Bounds concurrent requests to Kanoon across batch/CNR fan-outs
+        self._sem = asyncio.Semaphore(8)
+        # Self-throttle below the API's tolerance; backs off on 429
+        self._limiter = _AdaptiveRateLimiter(settings.kanoon_requests_per_second)
         logger.info(f"Indian Kanoon client initialized with base URL: {self.base_url}")
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client on first use (double-checked)."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    # Keep-alive pooling: every call targets the one
+                    # Kanoon host, so warm connections skip the TCP+TLS
+                    # handshake entirely
+                    self._client = httpx.AsyncClient(
+                        timeout=30.0,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=32,
+                            max_connections=64,
+                            keepalive_expiry=30.0,
+                        ),
+                        headers=_auth_headers()
+                    )
+        return self._client
+
+    async def ping(self) -> bool:
+        """
+        Cheap reachability probe for health checks.
+
+        Issues a HEAD request against the API root instead of a search,
+        so monitoring traffic does not consume search quota.
+
+        Returns:
+            True if the API host responded
+        """
+        try:
+            client = await self._get_client()
+            response = await client.head(f"{self.base_url}/")
+            return response.status_code < 500
+        except Exception as e:
+            logger.warning(f"Kanoon ping failed: {e}")
+            return False
+
+    async def _post(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        binary: bool = False,
+        retries: int = 3,
+    ) -> Any:
+        """
+        POST to Kanoon with retry on transient failures.
+
+        Fuses the request/raise_for_status/parse/log boilerplate every
+        endpoint repeated, and retries 429/5xx responses (honoring
+        Retry-After) plus transport errors with jittered backoff.
+
+        Args:
+            url: Full endpoint URL
+            data: Form parameters
+            binary: Return raw bytes instead of parsed JSON
+            retries: Retry attempts for transient failures
+
+        Returns:
+            Parsed JSON dict, or bytes when binary=True
+        """
+        for attempt in range(retries + 1):
+            await self._limiter.acquire()
+            try:
+                client = await self._get_client()
+                response = await client.post(url, data=data)
+                response.raise_for_status()
+                if binary:
+                    return response.content
+                # orjson decodes the multi-hundred-KB search payloads
+                # several times faster than httpx's stdlib-json .json()
+                return orjson.loads(response.content)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status == 429:
+                    self._limiter.backoff()
+                if status not in _RETRYABLE_STATUS or attempt == retries:
+                    logger.error(f"HTTP error from Kanoon {url}: {e}")
+                    raise
+                retry_after = e.response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = min(2 ** attempt, 8) * (0.5 + random.random())
+                logger.warning(f"Kanoon returned {status}, retrying in {delay:.1f}s: {url}")
+                await asyncio.sleep(delay)
+            except httpx.HTTPError as e:
+                # Transport-level error (timeout, reset); worth one more try
+                if attempt == retries:
+                    logger.error(f"Error calling Kanoon {url}: {e}")
+                    raise
+                delay = min(2 ** attempt, 8) * (0.5 + random.random())
+                logger.warning(f"Kanoon request failed ({e}), retrying in {delay:.1f}s: {url}")
+                await asyncio.sleep(delay)
+
+    @redis_memoize()
     async def search_documents(
         self,
         query: str,
@@ -81,19 +369,10 @@ class IndianKanoonClient:
         if bench:
             params["bench"] = bench
 
-        url = f"{self.base_url}/search/"
-        try:
-            # Indian Kanoon API requires POST for search endpoint
-            response = await self.client.post(url, data=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error in Kanoon search: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error in Kanoon search: {e}")
-            raise
+        # Indian Kanoon API requires POST for search endpoint
+        return await self._post(f"{self.base_url}/search/", data=params)
 
+    @redis_memoize()
     async def get_document(self, doc_id: str, maxcites: int = 10, maxcitedby: int = 10) -> Dict[str, Any]:
         """
         Get a document by ID.
@@ -112,19 +391,10 @@ class IndianKanoonClient:
         if maxcitedby:
             params["maxcitedby"] = maxcitedby
 
-        url = f"{self.base_url}/doc/{doc_id}/"
-        try:
-            # Indian Kanoon API requires POST for document retrieval
-            response = await self.client.post(url, data=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error getting Kanoon document {doc_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error getting Kanoon document {doc_id}: {e}")
-            raise
+        # Indian Kanoon API requires POST for document retrieval
+        return await self._post(f"{self.base_url}/doc/{doc_id}/", data=params)
 
+    @redis_memoize()
     async def get_document_metadata(self, doc_id: str) -> Dict[str, Any]:
         """
         Get document metadata.
@@ -135,42 +405,43 @@ class IndianKanoonClient:
         Returns:
             Dict containing document metadata
         """
-        url = f"{self.base_url}/docmeta/{doc_id}/"
-        try:
-            # Indian Kanoon API requires POST for metadata retrieval
-            response = await self.client.post(url)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error getting Kanoon metadata {doc_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error getting Kanoon metadata {doc_id}: {e}")
-            raise
+        # Indian Kanoon API requires POST for metadata retrieval
+        return await self._post(f"{self.base_url}/docmeta/{doc_id}/")
 
-    async def get_original_document(self, doc_id: str) -> bytes:
+    async def get_original_document(self, doc_id: str, sink=None) -> Optional[bytes]:
         """
         Get original court copy (PDF).
 
+        The response is consumed in 64 KiB chunks; with a sink the full
+        PDF never materializes in Python memory, which matters for
+        multi-MB judgment scans.
+
         Args:
             doc_id: Document ID from Kanoon
+            sink: Optional binary file-like object to stream the PDF
+                into; when given, returns None instead of the bytes
 
         Returns:
-            Bytes of the PDF document
+            Bytes of the PDF document, or None when written to sink
         """
         url = f"{self.base_url}/origdoc/{doc_id}/"
+        buffer = bytearray() if sink is None else None
         try:
             # Indian Kanoon API requires POST for original document retrieval
-            response = await self.client.post(url)
-            response.raise_for_status()
-            return response.content
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error getting Kanoon original {doc_id}: {e}")
-            raise
-        except Exception as e:
+            client = await self._get_client()
+            async with client.stream("POST", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(65536):
+                    if sink is not None:
+                        sink.write(chunk)
+                    else:
+                        buffer.extend(chunk)
+        except httpx.HTTPError as e:
             logger.error(f"Error getting Kanoon original {doc_id}: {e}")
             raise
+        return bytes(buffer) if buffer is not None else None
 
+    @redis_memoize()
     async def search_document_fragments(self, doc_id: str, query: str) -> Dict[str, Any]:
         """
         Search within a document for fragments.
@@ -182,19 +453,10 @@ class IndianKanoonClient:
         Returns:
             Dict containing document fragments
         """
-        params = {"formInput": query}
-        url = f"{self.base_url}/docfragment/{doc_id}/"
-        try:
-            # Indian Kanoon API requires POST for fragment search
-            response = await self.client.post(url, data=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error searching fragments in {doc_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error searching fragments in {doc_id}: {e}")
-            raise
+        # Indian Kanoon API requires POST for fragment search
+        return await self._post(
+            f"{self.base_url}/docfragment/{doc_id}/", data={"formInput": query}
+        )
 
     async def batch_search(
         self,
@@ -213,23 +475,27 @@ class IndianKanoonClient:
         Returns:
             List of search results for each query
         """
-        results = []
-        for query in queries:
-            try:
-                result = await self.search_documents(query=query, maxpages=limit_per_query)
-                results.append({
-                    "query": query,
-                    "results": result.get("results", []),
-                    "total": result.get("total", 0),
-                    "success": True
-                })
-            except Exception as e:
-                results.append({
-                    "query": query,
-                    "error": str(e),
-                    "success": False
-                })
-        return results
+        # Each query is independent network I/O, so fire them together
+        # (bounded by the shared semaphore) instead of paying one RTT per
+        # query in sequence
+        async def search_one(query: str) -> Dict[str, Any]:
+            async with self._sem:
+                try:
+                    result = await self.search_documents(query=query, maxpages=limit_per_query)
+                    return {
+                        "query": query,
+                        "results": result.get("results", []),
+                        "total": result.get("total", 0),
+                        "success": True
+                    }
+                except Exception as e:
+                    return {
+                        "query": query,
+                        "error": str(e),
+                        "success": False
+                    }
+
+        return list(await asyncio.gather(*(search_one(query) for query in queries)))
 
     def parse_search_result(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -242,21 +508,16 @@ class IndianKanoonClient:
             List of parsed documents
         """
         parsed_docs = []
-        for doc in result.get("results", []):
-            parsed_doc = {
-                "id": doc.get("tid"),
-                "title": doc.get("title"),
-                "citation": doc.get("cite"),
-                "court": doc.get("court"),
-                "date": doc.get("date"),
-                "author": doc.get("author"),
-                "bench": doc.get("bench"),
-                "size": doc.get("size", 0),
-                "snippet": doc.get("snippet"),
-                "score": doc.get("score", 0),
-                "type": doc.get("type"),
-            }
-            parsed_docs.append(parsed_doc)
+        for doc in result.get("results", ()):
+            try:
+                values = _RESULT_GETTER(doc)
+            except KeyError:
+                # Sparse row — fall back to per-key lookup with defaults
+                values = tuple(
+                    doc.get(key, _RESULT_DEFAULTS.get(key))
+                    for key in _RAW_RESULT_KEYS
+                )
+            parsed_docs.append(dict(zip(_PARSED_RESULT_KEYS, values)))
         return parsed_docs
 
     def generate_citation_search_queries(self, case_number: str, parties: List[str]) -> List[str]:
@@ -270,22 +531,19 @@ class IndianKanoonClient:
         Returns:
             List of search queries
         """
-        queries = []
-
         # Search by exact case number
-        queries.append(f'"{case_number}"')
+        queries = [f'"{case_number}"']
 
         # Search by parties
-        for party in parties[:3]:  # Limit to first 3 parties
-            if party:
-                queries.append(f'"{party}" AND "{case_number[:10]}"')  # First 10 chars of case number
+        prefix = case_number[:10]  # First 10 chars of case number
+        queries.extend(
+            f'"{party}" AND "{prefix}"' for party in parties[:3] if party
+        )
 
         # Search by citation pattern
         if "/" in case_number:
-            year = case_number.split("/")[-1]
-            queries.append(f'"{year}" AND "AIR"')
-            queries.append(f'"{year}" AND "SCC"')
-            queries.append(f'"{year}" AND "SCR"')
+            year = case_number.rsplit("/", 1)[-1]
+            queries.extend(p.format(y=year) for p in _CITATION_PATTERNS)
 
         return queries
 
@@ -300,47 +558,86 @@ class IndianKanoonClient:
         Returns:
             Dict containing search results with documents
         """
-        # CNR numbers can appear in different formats in documents
-        # Try different search patterns
-        search_patterns = [
-            f'"{cnr_number}"',                     # Exact CNR
-            f'CNR {cnr_number}',                   # CNR with space
-            f'CNR NO: {cnr_number}',              # Common format
-            f'CNR NO.{cnr_number}',               # Alternative format
-            f'CNR NO {cnr_number}',               # Without punctuation
-            f'Case Number Record: {cnr_number}',  # Full phrase
-        ]
-
-        all_results = []
-        total_found = 0
+        search_patterns = [p.format(c=cnr_number) for p in _CNR_PATTERNS]
 
-        for pattern in search_patterns:
-            try:
+        # Kanoon's formInput accepts boolean OR, so all variant spellings
+        # fold into one request — a sixth of the API cost of the
+        # per-pattern fan-out, which is kept only as a fallback for the
+        # rare case where the combined query parses oddly and misses
+        combined_query = " OR ".join(f"({p})" for p in search_patterns)
+        try:
+            combined = await self.search_documents(
+                query=combined_query,
+                maxpages=min(max_results, 5)
+            )
+        except Exception as e:
+            logger.warning(f"Combined CNR query failed, falling back to per-pattern: {e}")
+            combined = None
+
+        if combined and combined.get('results'):
+            unique_docs = {}
+            for doc in combined['results']:
+                doc_id = doc.get('tid')
+                if doc_id and doc_id not in unique_docs:
+                    unique_docs[doc_id] = doc
+                    if len(unique_docs) >= max_results:
+                        break
+            final_results = list(unique_docs.values())
+            return {
+                'cnr_number': cnr_number,
+                'total_found': combined.get('total', 0),
+                'unique_results': len(final_results),
+                'results': final_results,
+                'search_patterns_used': [combined_query],
+            }
+
+        # All patterns hit the same I/O-bound endpoint; fire them
+        # concurrently (bounded by the shared semaphore) and consume
+        # responses as they land so the fastest pattern fills the quota
+        async def search_pattern(pattern: str) -> Dict[str, Any]:
+            async with self._sem:
                 result = await self.search_documents(
                     query=pattern,
                     maxpages=min(max_results, 5)  # Limit pages per pattern
                 )
+            return {'pattern': pattern, 'result': result}
 
-                if result.get('results'):
-                    all_results.extend(result['results'])
-                    total_found = result.get('total', 0)
-                    logger.info(f"Found {len(result['results'])} documents with pattern: {pattern}")
-
-                    # If we found results, we can stop searching further patterns
-                    # or continue to collect more
-                    if len(all_results) >= max_results:
-                        break
-
-            except Exception as e:
-                logger.warning(f"Search with pattern '{pattern}' failed: {e}")
-                continue
+        tasks = [asyncio.create_task(search_pattern(p)) for p in search_patterns]
 
-        # Remove duplicates by document ID
         unique_docs = {}
-        for doc in all_results:
-            doc_id = doc.get('tid')
-            if doc_id and doc_id not in unique_docs:
-                unique_docs[doc_id] = doc
+        patterns_used = []
+        total_found = 0
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    outcome = await future
+                except Exception as e:
+                    logger.warning(f"CNR pattern search failed: {e}")
+                    continue
+
+                results = outcome['result'].get('results')
+                if not results:
+                    continue
+
+                patterns_used.append(outcome['pattern'])
+                total_found = outcome['result'].get('total', 0)
+                logger.info(f"Found {len(results)} documents with pattern: {outcome['pattern']}")
+
+                for doc in results:
+                    doc_id = doc.get('tid')
+                    if doc_id and doc_id not in unique_docs:
+                        unique_docs[doc_id] = doc
+                        if len(unique_docs) >= max_results:
+                            break
+
+                # Quota satisfied — cancel the still-inflight patterns
+                if len(unique_docs) >= max_results:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
         # Limit to max_results
         final_results = list(unique_docs.values())[:max_results]
@@ -350,7 +647,7 @@ class IndianKanoonClient:
             'total_found': total_found,
             'unique_results': len(final_results),
             'results': final_results,
-            'search_patterns_used': search_patterns[:len(all_results)] if all_results else []
+            'search_patterns_used': patterns_used
         }
 
     async def analyze_case_by_cnr(self, cnr_number: str) -> Dict[str, Any]:
@@ -391,26 +688,18 @@ class IndianKanoonClient:
         try:
             document = await self.get_document(doc_id)
 
-            # Step 4: Extract text for analysis
-            # The document response structure depends on Kanoon API
-            # This is a placeholder - actual text extraction may need adjustment
+            # Step 4: Extract text for analysis. The field name varies
+            # by document type, so walk the candidates in priority order
+            # (one .get per key — the old in-then-subscript branches
+            # hashed each key twice); fall back to the search snippet.
             document_text = ""
-
-            # Try to extract text from different possible fields
             if isinstance(document, dict):
-                # Check for text fields
-                if 'text' in document:
-                    document_text = document['text']
-                elif 'content' in document:
-                    document_text = document['content']
-                elif 'judgment' in document:
-                    document_text = document['judgment']
-                elif 'description' in document:
-                    document_text = document['description']
-
-            # If no text found, use snippet from search result
-            if not document_text and 'snippet' in primary_doc:
-                document_text = primary_doc['snippet']
+                document_text = next(
+                    (document.get(key) for key in _TEXT_KEYS if document.get(key)),
+                    ""
+                )
+            if not document_text:
+                document_text = primary_doc.get('snippet') or ""
 
             return {
                 'cnr_number': cnr_number,
@@ -420,7 +709,10 @@ class IndianKanoonClient:
                 'court': primary_doc.get('court', 'Unknown'),
                 'date': primary_doc.get('date', 'Unknown'),
                 'citation': primary_doc.get('cite', 'Unknown'),
-                'document_text': document_text[:5000],  # Limit text length
+                # Truncate only when actually long; slicing always
+                # allocates a copy even for short strings
+                'document_text': (document_text if len(document_text) <= 5000
+                                  else document_text[:5000]),
                 'metadata': {
                     'search_results': len(search_result['results']),
                     'total_found': search_result['total_found']
@@ -441,7 +733,9 @@ class IndianKanoonClient:
 
     async def close(self):
         """Close HTTP client."""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def __aenter__(self):
         return self
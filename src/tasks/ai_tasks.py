@@ -2,16 +2,70 @@
 AI analysis background tasks.
 Placeholder - actual implementations will be added later.
 """
+import asyncio
+
+from celery import chord, group
+
 from src.tasks.celery_app import celery_app
 
+# Per-worker-process singletons: each Celery worker keeps one event loop
+# and one Kanoon client alive, so its httpx connection pool stays warm
+# across tasks instead of being rebuilt per invocation.
+_worker_loop = None
+_worker_kanoon_client = None
+
+
+def _run(coro):
+    """Run a coroutine on this worker's persistent event loop."""
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(coro)
+
+
+def _get_worker_kanoon_client():
+    global _worker_kanoon_client
+    if _worker_kanoon_client is None:
+        from src.services.kanoon_service import IndianKanoonClient
+        _worker_kanoon_client = IndianKanoonClient()
+    return _worker_kanoon_client
+
+
+@celery_app.task
+def fetch_kanoon_doc(doc_id: str):
+    """Fetch one Kanoon document; fanned out via group/chord below."""
+    return _run(_get_worker_kanoon_client().get_document(doc_id))
+
+
+@celery_app.task
+def analyze_fetched_documents(documents, case_id: int):
+    """Chord callback: analyze the gathered documents for a case."""
+    # TODO: Implement aggregated AI analysis
+    raise NotImplementedError("Aggregated case analysis not implemented yet")
+
+
+def dispatch_case_document_analysis(case_id: int, doc_ids):
+    """
+    Fan document fetches out across workers and join into the AI step.
+
+    A group of fetch_kanoon_doc tasks scales with worker count instead
+    of one task looping over HTTP calls serially; the chord fires
+    analyze_fetched_documents once every fetch has landed.
+    """
+    header = group(fetch_kanoon_doc.s(doc_id) for doc_id in doc_ids)
+    return chord(header)(analyze_fetched_documents.s(case_id))
+
+
 @celery_app.task
 def analyze_document_with_ai(document_id: int, analysis_type: str = "summary"):
     """Perform AI analysis on document in background."""
     # TODO: Implement AI analysis
     raise NotImplementedError("AI analysis not implemented yet")
 
+
 @celery_app.task
 def analyze_case_with_ai(case_id: int):
     """Perform comprehensive AI analysis on case."""
-    # TODO: Implement case analysis
-    raise NotImplementedError("Case analysis not implemented yet")
\ No newline at end of file
+    # TODO: Implement case analysis (see dispatch_case_document_analysis
+    # for the document-fetch fan-out it should build on)
+    raise NotImplementedError("Case analysis not implemented yet")
@@ -4,13 +4,13 @@ This is a placeholder - actual task implementations will be added later.
 """
 import os
 from celery import Celery
-from src.config import settings
+from src.config.settings import settings
 
 # Create Celery application
 celery_app = Celery(
     "legal_saas",
-    broker=settings.redis_url,
-    backend=settings.redis_url,
+    broker=str(settings.redis_url),
+    backend=str(settings.redis_url),
     include=[
         # Task modules will be added here
         "src.tasks.document_tasks",
@@ -28,7 +28,25 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     worker_max_tasks_per_child=100,
-    worker_prefetch_multiplier=1,
+    # Our tasks are short; prefetching a few keeps workers fed instead
+    # of a broker round-trip per task
+    worker_prefetch_multiplier=4,
+    # Keep broker connections pooled and alive so .delay() from the API
+    # process doesn't reopen a Redis connection per submission
+    broker_pool_limit=50,
+    broker_transport_options={
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+        "retry_on_timeout": True,
+        "visibility_timeout": 3600,
+    },
+    result_backend_transport_options={
+        "socket_keepalive": True,
+        "retry_on_timeout": True,
+    },
+    # Redelivery over silent loss if a worker dies mid-task
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
 )
 
 # Optional: Configure periodic tasks (Celery Beat)